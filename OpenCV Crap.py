@@ -1,9 +1,162 @@
 import cv2
 import numpy as np
 import argparse
+import queue
+import threading
+import time
+
+# Numba is optional and the kernels are opt-in (use_numba / --numba) - they
+# only help on some scenes, OpenCV's own calls are the default
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Fixed-point reciprocal tables, the same ones OpenCV's 8-bit BGR->HSV uses,
+    # so S and H need no divisions
+    _HSV_SHIFT = 12
+    _SDIV = np.array([0] + [int(round((255 << _HSV_SHIFT) / i)) for i in range(1, 256)], np.int32)
+    _HDIV180 = np.array([0] + [int(round((180 << _HSV_SHIFT) / (6 * i))) for i in range(1, 256)], np.int32)
+
+    @njit(cache=True)
+    def _reflect(i, n):
+        # Same border handling as OpenCV's default (BORDER_REFLECT_101)
+        if i < 0:
+            return -i
+        if i >= n:
+            return 2 * n - i - 2
+        return i
+
+    @njit(parallel=True, boundscheck=False, cache=True)
+    def blur_thresh(gray, out, thr):
+        """
+        5x5 Gaussian blur + binary threshold in a single pass
+        Integer [1, 4, 6, 4, 1] taps; border reflection is only worked out
+        for the two edge pixels on each side, not inside the inner loop
+
+        Args:
+            gray: Grayscale input image (uint8)
+            out: Output mask, same shape as gray (uint8)
+            thr: Pixels brighter than this become 255, the rest 0
+        """
+        H, W = gray.shape
+        for y in prange(H):
+            # Source rows for this output row, reflected once per row
+            r0 = gray[_reflect(y - 2, H)]
+            r1 = gray[_reflect(y - 1, H)]
+            r2 = gray[y]
+            r3 = gray[_reflect(y + 1, H)]
+            r4 = gray[_reflect(y + 2, H)]
+
+            # Vertical pass for this row, kept in a small row buffer
+            row = np.empty(W, dtype=np.int32)
+            for x in range(W):
+                row[x] = (np.int32(r0[x]) + np.int32(r4[x])
+                          + 4 * (np.int32(r1[x]) + np.int32(r3[x])) + 6 * np.int32(r2[x]))
+
+            # Horizontal pass + threshold, straight into the mask (sum of taps is 256)
+            for x in range(2, W - 2):
+                acc = row[x - 2] + row[x + 2] + 4 * (row[x - 1] + row[x + 1]) + 6 * row[x]
+                out[y, x] = 255 if (acc + 128) >> 8 > thr else 0
+            for x in (0, 1, W - 2, W - 1):
+                if 0 <= x < W:
+                    acc = (row[_reflect(x - 2, W)] + row[_reflect(x + 2, W)]
+                           + 4 * (row[_reflect(x - 1, W)] + row[_reflect(x + 1, W)]) + 6 * row[x])
+                    out[y, x] = 255 if (acc + 128) >> 8 > thr else 0
+
+    @njit(parallel=True, boundscheck=False, cache=True)
+    def hsv_mask(bgr, lowers, uppers, out):
+        """
+        BGR -> HSV + inRange over one or more ranges, straight to a mask
+        V is checked first, then S, and H is only worked out for pixels that
+        got that far. Same integer maths and 8-bit scale as OpenCV (H 0-180).
+
+        Args:
+            bgr: Input frame (uint8, 3 channels)
+            lowers: (k, 3) array of lower HSV bounds
+            uppers: (k, 3) array of upper HSV bounds
+            out: Output mask (uint8), 255 where any range matches
+        """
+        H, W = bgr.shape[:2]
+        k = lowers.shape[0]
+        v_min = lowers[:, 2].min()
+        s_min = lowers[:, 1].min()
+        for y in prange(H):
+            for x in range(W):
+                # Signed, so g - b etc. can go negative instead of wrapping
+                b = np.int32(bgr[y, x, 0])
+                g = np.int32(bgr[y, x, 1])
+                r = np.int32(bgr[y, x, 2])
+
+                # V: cheapest, rejects most of a typical frame
+                v = max(b, g, r)
+                if v < v_min:
+                    out[y, x] = 0
+                    continue
+
+                # S: only for pixels bright enough
+                diff = v - min(b, g, r)
+                s = (diff * _SDIV[v] + (1 << (_HSV_SHIFT - 1))) >> _HSV_SHIFT
+                if s < s_min:
+                    out[y, x] = 0
+                    continue
+
+                # H: only for bright, saturated pixels
+                if v == r:
+                    h = g - b
+                elif v == g:
+                    h = b - r + 2 * diff
+                else:
+                    h = r - g + 4 * diff
+                h = (h * _HDIV180[diff] + (1 << (_HSV_SHIFT - 1))) >> _HSV_SHIFT
+                if h < 0:
+                    h += 180
+
+                m = 0
+                for i in range(k):
+                    if (lowers[i, 0] <= h <= uppers[i, 0] and
+                            lowers[i, 1] <= s <= uppers[i, 1] and
+                            lowers[i, 2] <= v <= uppers[i, 2]):
+                        m = 255
+                        break
+                out[y, x] = m
+else:
+    blur_thresh = None
+    hsv_mask = None
+
+# HSV ranges for different laser colors
+COLOR_RANGES = {
+    'red': [(0, 50, 50), (10, 255, 255)],  # Red range 1
+    'red2': [(170, 50, 50), (180, 255, 255)],  # Red range 2 (wraps around)
+    'green': [(40, 50, 50), (80, 255, 255)],
+    'blue': [(100, 50, 50), (130, 255, 255)]
+}
+
+# BGR colors of a typical laser dot for each HSV color, used for the
+# synthetic test frames
+DOT_COLORS = {
+    'red': (60, 40, 230),
+    'green': (20, 220, 60),
+    'blue': (230, 90, 40)
+}
+
+# Trail fade colors, one per band from oldest (dim) to newest (bright)
+TRAIL_BANDS = 8
+TRAIL_COLORS = [(0, int(255 * (b + 1) / TRAIL_BANDS), 0) for b in range(TRAIL_BANDS)]
+
+def cuda_available():
+    """
+    Check if this OpenCV build has CUDA support and a usable GPU
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
 
 class LaserPointerDetector:
-    def __init__(self, min_area=10, max_area=500, brightness_threshold=200):
+    def __init__(self, min_area=10, max_area=500, brightness_threshold=200, use_cuda=False,
+                 scale=1, skip_static=False, roi_radius=80, use_numba=False):
         """
         Initialize laser pointer detector
 
@@ -11,14 +164,212 @@ class LaserPointerDetector:
             min_area: Minimum area of detected blob
             max_area: Maximum area of detected blob
             brightness_threshold: Minimum brightness for laser detection
+            use_cuda: Run grayscale/blur/threshold on the GPU if available
+            scale: Run detection on a frame this many times smaller (1 = full size)
+                   Faster, but small dots can drop below min_area and be missed
+            skip_static: Reuse the last result when the frame is bit-identical to the
+                         last one. Off by default: live webcam frames almost never
+                         repeat exactly, so the check is usually pure overhead
+            roi_radius: Half-size of the search window around the predicted position
+            use_numba: Use the numba kernels instead of the OpenCV calls (if installed)
         """
         self.min_area = min_area
         self.max_area = max_area
         self.brightness_threshold = brightness_threshold
+        self.scale = max(1, int(scale))
+        self.use_numba = use_numba and njit is not None
+
+        # GPU state is created once and reused for every frame
+        self.use_cuda = use_cuda and cuda_available()
+        if self.use_cuda:
+            self._gpu_src = cv2.cuda_GpuMat()
+            self._stream = cv2.cuda.Stream()
+            # Second stream + events so gray can download while blur/threshold run
+            self._copy_stream = cv2.cuda.Stream()
+            self._gray_ready = cv2.cuda_Event()
+            self._gray_copied = cv2.cuda_Event()
+            self._thresh_copied = cv2.cuda_Event()
+            self._gauss = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (5, 5), 0)
 
         # Previous position for smoothing
         self.prev_pos = None
 
+        # Constant-velocity Kalman filter (state x, y, vx, vy) for smoothing
+        # and for predicting where to search next frame
+        self.roi_radius = roi_radius
+        self.kf = cv2.KalmanFilter(4, 2)
+        self.kf.transitionMatrix = np.array([[1, 0, 1, 0],
+                                             [0, 1, 0, 1],
+                                             [0, 0, 1, 0],
+                                             [0, 0, 0, 1]], np.float32)
+        self.kf.measurementMatrix = np.array([[1, 0, 0, 0],
+                                              [0, 1, 0, 0]], np.float32)
+        self.kf.processNoiseCov = np.eye(4, dtype=np.float32) * 0.03
+        self.kf.measurementNoiseCov = np.eye(2, dtype=np.float32) * 0.1
+        self._locked = False
+
+        # HSV bounds as uint8 arrays, built once instead of every frame
+        self._hsv_bounds = {k: (np.array(v[0], np.uint8), np.array(v[1], np.uint8))
+                            for k, v in COLOR_RANGES.items()}
+        self._kernel3 = np.ones((3, 3), np.uint8)
+
+        # Same bounds stacked per laser color for the numba HSV kernel
+        # (red gets both of its ranges)
+        self._hsv_stacks = {}
+        for color in ('red', 'green', 'blue'):
+            ranges = [COLOR_RANGES[color]] + ([COLOR_RANGES['red2']] if color == 'red' else [])
+            self._hsv_stacks[color] = (np.array([r[0] for r in ranges], np.int32),
+                                       np.array([r[1] for r in ranges], np.int32))
+
+        # Scratch images reused between frames, allocated on first use
+        self._scratch = {}
+
+        # Unchanged-frame skip: copy of the last frame and its result
+        self.skip_static = skip_static
+        self._last_key = None
+        self._last_pos = None
+
+    def _buffer(self, name, shape):
+        """
+        Get a reusable uint8 scratch image, only reallocating if the size changes
+        """
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            self._scratch[name] = buf
+        return buf
+
+    def _frame_unchanged(self, frame, key):
+        """
+        Check for a bit-identical repeated frame, done before any real preprocessing
+        Every 16th pixel is compared first (cheap, rules out nearly every
+        changed frame), and only a match is confirmed against the full frame
+
+        Args:
+            frame: Input frame
+            key: Which detection ran, so switching method never reuses a result
+
+        Returns:
+            bool: True if the frame matches the last one and the last result can be reused
+        """
+        if not self.skip_static:
+            return False
+        last_frame = self._scratch.get('last_frame')
+        unchanged = (key == self._last_key
+                     and last_frame is not None and last_frame.shape == frame.shape
+                     and np.array_equal(frame[::16, ::16], last_frame[::16, ::16])
+                     and np.array_equal(frame, last_frame))
+        if not unchanged:
+            np.copyto(self._buffer('last_frame', frame.shape), frame)
+            self._last_key = key
+        return unchanged
+
+    def _downscale(self, frame):
+        """
+        Shrink a frame by self.scale before detection
+        The downscale blurs the dot on top of the usual blur, so small dots
+        shrink faster than scale^2 and may fall under min_area
+        """
+        if self.scale == 1:
+            return frame
+        h, w = frame.shape[:2]
+        if self.scale == 2:
+            small = self._buffer('small', ((h + 1) // 2, (w + 1) // 2) + frame.shape[2:])
+            return cv2.pyrDown(frame, dst=small)
+        size = (max(1, w // self.scale), max(1, h // self.scale))
+        small = self._buffer('small', (size[1], size[0]) + frame.shape[2:])
+        return cv2.resize(frame, size, dst=small, interpolation=cv2.INTER_AREA)
+
+    def _to_full(self, x, y):
+        """
+        Map a point in the downscaled frame back to full-frame pixels
+
+        Returns:
+            tuple: (x, y) as ints
+        """
+        if self.scale <= 2:
+            # pyrDown keeps the even source pixels, so pixel i is at 2i
+            return (int(x * self.scale), int(y * self.scale))
+        # INTER_AREA pixel i covers source pixels [i*s, (i+1)*s), centre (i+0.5)*s-0.5
+        s = self.scale
+        return (int((x + 0.5) * s - 0.5), int((y + 0.5) * s - 0.5))
+
+    def _area_limits(self):
+        """
+        Area limits adjusted for the downscaled frame
+
+        Returns:
+            tuple: (min_area, max_area)
+        """
+        s2 = self.scale * self.scale
+        return self.min_area / s2, self.max_area / s2
+
+    def _threshold_cpu(self, frame):
+        """
+        Grayscale, blur and threshold a frame on the CPU
+
+        Returns:
+            tuple: (gray, thresh) images, thresh is None if nothing is bright enough
+        """
+        shape = frame.shape[:2]
+        gray = self._buffer('gray', shape)
+        thresh = self._buffer('thresh', shape)
+
+        # Convert to grayscale
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+        # Blurring can't make anything brighter, so if the brightest pixel is
+        # under the threshold there is no laser and we can skip the rest
+        _, max_val, _, _ = cv2.minMaxLoc(gray)
+        if max_val <= self.brightness_threshold:
+            return gray, None
+
+        if self.use_numba and min(shape) >= 3:
+            # Blur + threshold fused into one pass over the image
+            blur_thresh(gray, thresh, self.brightness_threshold)
+        else:
+            # Apply Gaussian blur to reduce noise
+            blurred = self._buffer('blur', shape)
+            cv2.GaussianBlur(gray, (5, 5), 0, dst=blurred)
+
+            # Threshold to find bright spots
+            cv2.threshold(blurred, self.brightness_threshold, 255, cv2.THRESH_BINARY, dst=thresh)
+
+        return gray, thresh
+
+    def _threshold_cuda(self, frame):
+        """
+        Grayscale, blur and threshold a frame on the GPU
+        Only one upload per frame; contours still run on the CPU
+
+        Returns:
+            tuple: (gray, thresh) images
+        """
+        self._gpu_src.upload(frame, self._stream)
+        gpu_gray = cv2.cuda.cvtColor(self._gpu_src, cv2.COLOR_BGR2GRAY, stream=self._stream)
+        self._gray_ready.record(self._stream)
+
+        # Queue blur + threshold before any download: downloading into numpy
+        # (pageable) memory blocks the host until the copy is done
+        gpu_blur = self._gauss.apply(gpu_gray, stream=self._stream)
+        _, gpu_thresh = cv2.cuda.threshold(gpu_blur, self.brightness_threshold, 255,
+                                           cv2.THRESH_BINARY, stream=self._stream)
+
+        # Gray is still needed on the CPU for the blob brightness - copy it
+        # back on the other stream while the GPU runs blur + threshold
+        self._copy_stream.waitEvent(self._gray_ready)
+        gray = gpu_gray.download(stream=self._copy_stream)
+        self._gray_copied.record(self._copy_stream)
+
+        thresh = gpu_thresh.download(stream=self._stream)
+        self._thresh_copied.record(self._stream)
+
+        # Wait for just the two copies rather than whole streams
+        self._gray_copied.waitForCompletion()
+        self._thresh_copied.waitForCompletion()
+
+        return gray, thresh
+
     def detect_laser(self, frame):
         """
         Detect laser pointer in frame
@@ -29,56 +380,110 @@ class LaserPointerDetector:
         Returns:
             tuple: (x, y) coordinates of laser pointer, or None if not found
         """
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self._frame_unchanged(frame, 'brightness'):
+            return self._last_pos
+        self._last_pos = self._track(frame, self._detect_brightness, smooth=True)
+        return self._last_pos
 
-        # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    def _track(self, frame, detect, smooth):
+        """
+        Search a small window around the Kalman prediction, falling back to
+        the whole frame when there is no lock or the laser left the window
 
-        # Threshold to find bright spots
-        _, thresh = cv2.threshold(blurred, self.brightness_threshold, 255, cv2.THRESH_BINARY)
+        Args:
+            frame: Input frame
+            detect: Detection function returning (x, y) in its input's coordinates
+            smooth: Return the filtered position instead of the raw detection
 
-        # Find contours
-        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        Returns:
+            tuple: (x, y) coordinates of laser pointer, or None if not found
+        """
+        pos = None
+        jumped = not self._locked
+        if self._locked:
+            pred = self.kf.predict()
+        if self._locked and self.roi_radius:
+            r = self.roi_radius
+            h, w = frame.shape[:2]
+            # Keep the window inside the frame even if the prediction overshoots
+            x0 = min(max(0, int(pred[0, 0]) - r), max(0, w - 2 * r))
+            y0 = min(max(0, int(pred[1, 0]) - r), max(0, h - 2 * r))
+            sub = frame[y0:y0 + 2 * r, x0:x0 + 2 * r]
+            min_side = 3 * self.scale
+            if sub.shape[0] >= min_side and sub.shape[1] >= min_side:
+                pos = detect(sub)
+            if pos is not None:
+                pos = (pos[0] + x0, pos[1] + y0)
+            else:
+                jumped = True
 
-        if not contours:
-            return None
+        if pos is None:
+            pos = detect(frame)
+            if pos is None:
+                self._locked = False
+                return None
 
-        # Filter contours by area and find the brightest one
-        valid_contours = []
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if self.min_area <= area <= self.max_area:
-                # Get bounding rectangle
-                x, y, w, h = cv2.boundingRect(contour)
+        if jumped:
+            # (Re)start the filter on the new position
+            state = np.array([[pos[0]], [pos[1]], [0], [0]], np.float32)
+            self.kf.statePre = state.copy()
+            self.kf.statePost = state
+            self.kf.errorCovPre = np.eye(4, dtype=np.float32)
+            self.kf.errorCovPost = np.eye(4, dtype=np.float32)
+            self._locked = True
 
-                # Calculate average brightness in the region
-                roi = gray[y:y+h, x:x+w]
-                avg_brightness = np.mean(roi)
+        est = self.kf.correct(np.array([[pos[0]], [pos[1]]], np.float32))
+        if smooth:
+            pos = (int(est[0, 0]), int(est[1, 0]))
+            self.prev_pos = pos
+        return pos
+
+    def _detect_brightness(self, frame):
+        """
+        Brightness detection on a full frame (see detect_laser)
+        """
+        frame = self._downscale(frame)
+        min_area, max_area = self._area_limits()
 
-                valid_contours.append((contour, avg_brightness))
+        if self.use_cuda:
+            gray, thresh = self._threshold_cuda(frame)
+        else:
+            gray, thresh = self._threshold_cpu(frame)
+            if thresh is None:
+                return None
 
-        if not valid_contours:
+        # Only label the box that holds any bright pixels - usually just the dot
+        bx, by, bw, bh = cv2.boundingRect(thresh)
+        if bw == 0 or bh == 0:
             return None
+        thresh = thresh[by:by + bh, bx:bx + bw]
+        gray = gray[by:by + bh, bx:bx + bw]
+
+        # Label every bright blob in one pass (gives areas and centroids for free)
+        n, labels, stats, centroids = cv2.connectedComponentsWithStats(thresh, connectivity=8)
 
-        # Select the brightest contour
-        brightest_contour = max(valid_contours, key=lambda x: x[1])[0]
+        if n <= 1:
+            return None
 
-        # Calculate centroid
-        M = cv2.moments(brightest_contour)
-        if M["m00"] != 0:
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
+        # Filter blobs by area (label 0 is the background)
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        keep = (areas >= min_area) & (areas <= max_area)
 
-            # Simple smoothing with previous position
-            if self.prev_pos is not None:
-                cx = int(0.7 * cx + 0.3 * self.prev_pos[0])
-                cy = int(0.7 * cy + 0.3 * self.prev_pos[1])
+        if not keep.any():
+            return None
 
-            self.prev_pos = (cx, cy)
-            return (cx, cy)
+        # Average brightness of each kept blob, only looking inside its own
+        # bounding box (never touches the background of the whole frame)
+        best, best_mean = -1, -1.0
+        for i in np.flatnonzero(keep):
+            x, y, w, h = stats[i + 1, :4]
+            blob = labels[y:y + h, x:x + w] == i + 1
+            mean = gray[y:y + h, x:x + w][blob].mean()
+            if mean > best_mean:
+                best, best_mean = i, mean
 
-        return None
+        # Centroid comes straight from the labelling, scaled back to full size
+        return self._to_full(centroids[best + 1][0] + bx, centroids[best + 1][1] + by)
 
     def detect_laser_hsv(self, frame, laser_color='red'):
         """
@@ -92,29 +497,58 @@ class LaserPointerDetector:
         Returns:
             tuple: (x, y) coordinates of laser pointer, or None if not found
         """
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+        if self._frame_unchanged(frame, ('hsv', laser_color)):
+            return self._last_pos
+        self._last_pos = self._track(frame, lambda f: self._detect_hsv(f, laser_color),
+                                     smooth=False)
+        return self._last_pos
 
-        # Define HSV ranges for different laser colors
-        color_ranges = {
-            'red': [(0, 50, 50), (10, 255, 255)],  # Red range 1
-            'red2': [(170, 50, 50), (180, 255, 255)],  # Red range 2 (wraps around)
-            'green': [(40, 50, 50), (80, 255, 255)],
-            'blue': [(100, 50, 50), (130, 255, 255)]
-        }
+    def _hsv_image(self, frame):
+        """
+        Convert a frame to HSV into the reusable scratch image
+        """
+        hsv = self._buffer('hsv', frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=hsv)
+        return hsv
 
-        if laser_color == 'red':
+    def _hsv_mask(self, frame, laser_color, mask, use_numba):
+        """
+        HSV range mask + open/close cleanup
+        The range test runs in the numba hsv_mask kernel if use_numba, else
+        with cvtColor + inRange. Cleanup is always OpenCV's erode/dilate.
+        """
+        shape = frame.shape[:2]
+        if use_numba:
+            # BGR straight to the range mask, no HSV image needed
+            hsv_mask(frame, *self._hsv_stacks[laser_color], mask)
+        elif laser_color == 'red':
             # Red has two ranges due to HSV wrap-around
-            mask1 = cv2.inRange(hsv, np.array(color_ranges['red'][0]), np.array(color_ranges['red'][1]))
-            mask2 = cv2.inRange(hsv, np.array(color_ranges['red2'][0]), np.array(color_ranges['red2'][1]))
-            mask = cv2.bitwise_or(mask1, mask2)
+            hsv = self._hsv_image(frame)
+            mask1 = self._buffer('mask1', shape)
+            mask2 = self._buffer('mask2', shape)
+            cv2.inRange(hsv, *self._hsv_bounds['red'], dst=mask1)
+            cv2.inRange(hsv, *self._hsv_bounds['red2'], dst=mask2)
+            cv2.bitwise_or(mask1, mask2, dst=mask)
         else:
-            lower, upper = color_ranges[laser_color]
-            mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
+            cv2.inRange(self._hsv_image(frame), *self._hsv_bounds[laser_color], dst=mask)
 
         # Apply morphological operations to clean up the mask
-        kernel = np.ones((3, 3), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        # (open then close = erode, dilate twice, erode - done in place)
+        cv2.erode(mask, self._kernel3, dst=mask)
+        cv2.dilate(mask, self._kernel3, dst=mask, iterations=2)
+        cv2.erode(mask, self._kernel3, dst=mask)
+
+    def _detect_hsv(self, frame, laser_color):
+        """
+        HSV detection on a full frame (see detect_laser_hsv)
+        """
+        frame = self._downscale(frame)
+        min_area, max_area = self._area_limits()
+
+        shape = frame.shape[:2]
+        mask = self._buffer('mask', shape)
+
+        self._hsv_mask(frame, laser_color, mask, self.use_numba)
 
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -124,15 +558,372 @@ class LaserPointerDetector:
             largest_contour = max(contours, key=cv2.contourArea)
             area = cv2.contourArea(largest_contour)
 
-            if self.min_area <= area <= self.max_area:
+            if min_area <= area <= max_area:
                 M = cv2.moments(largest_contour)
                 if M["m00"] != 0:
-                    cx = int(M["m10"] / M["m00"])
-                    cy = int(M["m01"] / M["m00"])
-                    return (cx, cy)
+                    return self._to_full(M["m10"] / M["m00"], M["m01"] / M["m00"])
 
         return None
 
+class Trail:
+    def __init__(self, capacity=50):
+        """
+        Fixed-size trail of recent laser positions, kept in a preallocated
+        ring buffer so drawing never needs a new array
+
+        Args:
+            capacity: Maximum number of points kept
+        """
+        self.capacity = capacity
+        # Every point is stored twice (at i and i + capacity) so the points
+        # in order are always one contiguous slice, even after wrapping
+        self._pts = np.zeros((2 * capacity, 2), np.int32)
+        self._head = 0
+        self._len = 0
+
+        # Fade bands for each possible length: (color, first point, end point)
+        # Segment i joins points i-1 and i, bands share their end point
+        self._bands = {}
+        for n in range(2, capacity + 1):
+            bands = []
+            for i in range(1, n):
+                b = i * TRAIL_BANDS // n
+                if bands and bands[-1][0] == TRAIL_COLORS[b]:
+                    bands[-1][2] = i + 1
+                else:
+                    bands.append([TRAIL_COLORS[b], i - 1, i + 1])
+            self._bands[n] = bands
+
+    def __len__(self):
+        return self._len
+
+    def append(self, x, y):
+        """
+        Add a point, dropping the oldest one when full
+        """
+        self._pts[self._head] = (x, y)
+        self._pts[self._head + self.capacity] = (x, y)
+        self._head = (self._head + 1) % self.capacity
+        self._len = min(self._len + 1, self.capacity)
+
+    def clear(self):
+        self._head = 0
+        self._len = 0
+
+    def points(self):
+        """
+        Returns:
+            ndarray: View of the points from oldest to newest
+        """
+        start = (self._head - self._len) % self.capacity
+        return self._pts[start:start + self._len]
+
+    def draw(self, frame, thickness=2):
+        """
+        Draw the trail with a fade, one polylines call per color band
+        """
+        if self._len < 2:
+            return
+        pts = self.points()
+        for color, start, end in self._bands[self._len]:
+            cv2.polylines(frame, [pts[start:end]], False, color, thickness)
+
+def put_latest(q, item):
+    """
+    Put item on a bounded queue, dropping the oldest entry if it is full
+    so the consumer always gets the newest frame
+
+    Returns:
+        bool: True if an old entry was dropped
+    """
+    dropped = False
+    if q.full():
+        try:
+            q.get_nowait()
+            dropped = True
+        except queue.Empty:
+            pass
+    q.put(item)
+    return dropped
+
+def max_safe_scale(args, base_scale=1, limit=8, shape=(480, 640), use_numba=False):
+    """
+    Find the largest scale that still detects the smallest dot that is
+    detected at base_scale, using synthetic frames with a single dot
+
+    With the default min_area this is usually base_scale itself (the extra
+    blur from downscaling loses the smallest dots), i.e. no stepping at all
+
+    Returns:
+        int: Largest safe scale (base_scale if none higher is safe)
+    """
+    dot_color = (255, 255, 255) if args.method == 'brightness' else DOT_COLORS[args.color]
+    center = (shape[1] // 2, shape[0] // 2)
+
+    def finds(scale, radius):
+        det = LaserPointerDetector(min_area=args.min_area, max_area=args.max_area,
+                                   brightness_threshold=args.threshold, scale=scale,
+                                   skip_static=False, roi_radius=0, use_numba=use_numba)
+        frame = np.zeros(shape + (3,), np.uint8)
+        cv2.circle(frame, center, radius, dot_color, -1)
+        if args.method == 'brightness':
+            return det.detect_laser(frame) is not None
+        return det.detect_laser_hsv(frame, args.color) is not None
+
+    # Smallest dot the normal setting can see
+    radius = next((r for r in range(1, 31) if finds(base_scale, r)), None)
+    if radius is None:
+        return base_scale
+
+    best = base_scale
+    scale = base_scale * 2
+    while scale <= limit and finds(scale, radius):
+        best = scale
+        scale *= 2
+    return best
+
+def capture_loop(cap, q_frames, stop, capture_stats):
+    """
+    Capture thread: read frames from the camera and hand them to detection
+    Frames it has to throw away are counted in capture_stats['dropped']
+    """
+    # Always stop the other threads, even if this one dies with an exception
+    try:
+        while not stop.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                print("Error: Could not read frame")
+                break
+            if put_latest(q_frames, frame):
+                capture_stats['dropped'] += 1
+    finally:
+        stop.set()
+
+def detect_loop(detector, args, q_frames, q_results, stop, capture_stats, fps_target=30.0,
+                stats_interval=5.0, max_scale=None):
+    """
+    Detection thread: run the detector on the newest frame
+
+    If detection is slower than the camera, frames waiting in the queue are
+    skipped so the result never lags far behind. If it keeps falling behind,
+    detection resolution is lowered (up to max_scale), and raised again
+    once it catches up.
+
+    max_scale=None works out the limit with max_safe_scale the first time
+    detection falls behind (not at startup). If no lower resolution keeps
+    min_area dots detectable - the usual case for the brightness method with
+    default settings - resolution stepping stays off and only frame
+    dropping is used.
+    """
+    t_detect = 0.0
+    dropped = 0
+    capture_seen = 0
+    base_scale = detector.scale
+    last_stats = time.monotonic()
+
+    # Always stop the other threads, even if this one dies with an exception
+    try:
+        while not stop.is_set():
+            try:
+                frame = q_frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Behind the camera - jump to the newest frame waiting
+            if t_detect > 1.0 / fps_target:
+                while True:
+                    try:
+                        frame = q_frames.get_nowait()
+                        dropped += 1
+                    except queue.Empty:
+                        break
+
+            start = time.monotonic()
+
+            # Detect laser pointer
+            if args.method == 'brightness':
+                laser_pos = detector.detect_laser(frame)
+            else:
+                laser_pos = detector.detect_laser_hsv(frame, args.color)
+
+            # Rolling average of detection time
+            t_detect = 0.9 * t_detect + 0.1 * (time.monotonic() - start)
+
+            put_latest(q_results, (frame, laser_pos))
+
+            now = time.monotonic()
+            if now - last_stats >= stats_interval:
+                # Count frames dropped here and in the capture thread
+                capture_total = capture_stats['dropped']
+                dropped += capture_total - capture_seen
+                capture_seen = capture_total
+                drop_rate = dropped / (now - last_stats)
+                print(f"detect={t_detect * 1000:.1f}ms queue={q_frames.qsize()} dropped/s={drop_rate:.1f}")
+
+                # Hysteresis: step down resolution when badly behind, back up only
+                # once almost nothing is dropped and ~4x the pixels would still fit
+                # comfortably in a frame period
+                behind = drop_rate > fps_target / 4
+                if behind and max_scale is None:
+                    max_scale = max_safe_scale(args, base_scale, use_numba=detector.use_numba)
+                    if max_scale == base_scale:
+                        print("No lower resolution still detects min_area dots, "
+                              "resolution stepping is off (dropping frames only)")
+                if behind and detector.scale * 2 <= max_scale:
+                    detector.scale *= 2
+                    print(f"Detection falling behind, scale raised to {detector.scale}")
+                elif (drop_rate < fps_target / 20 and detector.scale > base_scale
+                      and t_detect * 4 < 0.5 / fps_target):
+                    detector.scale //= 2
+                    print(f"Detection caught up, scale lowered to {detector.scale}")
+                dropped = 0
+                last_stats = now
+    finally:
+        stop.set()
+
+def render_info_overlay(args, width, height=80):
+    """
+    Draw the fixed info text once into a strip the width of the frame
+
+    Returns:
+        tuple: (overlay, mask) where mask marks the text pixels
+    """
+    overlay = np.zeros((height, width, 3), np.uint8)
+
+    # Display detection method and parameters
+    info_text = f"Method: {args.method} | Threshold: {args.threshold}"
+    cv2.putText(overlay, info_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+
+    if args.method == 'hsv':
+        color_text = f"Color: {args.color}"
+        cv2.putText(overlay, color_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+
+    return overlay, overlay.any(axis=2)
+
+def time_call(fn, repeat=20):
+    """
+    Returns:
+        float: Best time of fn() in milliseconds
+    """
+    fn()  # warm up (and JIT compile)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def check_blur_kernel(size=(1080, 1920), thr=200, seed=0):
+    """
+    Compare blur_thresh with cv2.GaussianBlur + cv2.threshold on a random
+    frame, and time both
+
+    Returns:
+        bool: True if they agree (or numba isn't installed)
+    """
+    if njit is None:
+        print("numba not installed, nothing to check")
+        return True
+
+    gray = np.random.default_rng(seed).integers(0, 256, size, dtype=np.uint8)
+    expected = np.empty(size, np.uint8)
+    blurred = np.empty(size, np.uint8)
+    mask = np.empty(size, np.uint8)
+
+    def with_cv2():
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=blurred)
+        cv2.threshold(blurred, thr, 255, cv2.THRESH_BINARY, dst=expected)
+
+    t_cv2 = time_call(with_cv2)
+    t_numba = time_call(lambda: blur_thresh(gray, mask, thr))
+    bad = np.count_nonzero(mask != expected)
+    print(f"blur_thresh: {bad} mismatched pixels, numba {t_numba:.2f}ms vs cv2 {t_cv2:.2f}ms")
+    return bad == 0
+
+def check_hsv_kernel(frames=20, size=(240, 320), seed=0):
+    """
+    Compare the numba hsv_mask kernel with cv2.cvtColor + cv2.inRange on
+    random frames, and time both. They use the same integer maths, but
+    pixels within 1 of an H or S bound are still ignored in case an OpenCV
+    build (e.g. a SIMD path) rounds differently there.
+
+    Returns:
+        bool: True if they agree (or numba isn't installed)
+    """
+    if hsv_mask is None:
+        print("numba not installed, nothing to check")
+        return True
+
+    detector = LaserPointerDetector()
+    rng = np.random.default_rng(seed)
+    ok = True
+    for color in ('red', 'green', 'blue'):
+        lowers, uppers = detector._hsv_stacks[color]
+        bad = 0
+        for _ in range(frames):
+            frame = rng.integers(0, 256, size + (3,), dtype=np.uint8)
+            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV).astype(np.int32)
+
+            expected = np.zeros(size, bool)
+            near_bound = np.zeros(size, bool)
+            for lo, hi in zip(lowers, uppers):
+                expected |= np.all((hsv >= lo) & (hsv <= hi), axis=2)
+                for c in (0, 1):
+                    near_bound |= (np.abs(hsv[..., c] - lo[c]) <= 1) | (np.abs(hsv[..., c] - hi[c]) <= 1)
+
+            mask = np.empty(size, np.uint8)
+            hsv_mask(frame, lowers, uppers, mask)
+            bad += np.count_nonzero(((mask > 0) != expected) & ~near_bound)
+
+        print(f"hsv_mask {color}: {bad} mismatched pixels")
+        ok = ok and bad == 0
+
+    # Timing on a smooth, saturated 1080p scene - the worst case for the
+    # early V/S rejects, since almost every pixel survives them
+    hue = np.tile(np.linspace(0, 179, 1920, dtype=np.uint8), (1080, 1))
+    scene = cv2.cvtColor(np.dstack([hue, np.full_like(hue, 200), np.full_like(hue, 200)]),
+                         cv2.COLOR_HSV2BGR)
+    lowers, uppers = detector._hsv_stacks['green']
+    mask = np.empty(hue.shape, np.uint8)
+    t_numba = time_call(lambda: hsv_mask(scene, lowers, uppers, mask))
+    t_cv2 = time_call(lambda: cv2.inRange(cv2.cvtColor(scene, cv2.COLOR_BGR2HSV),
+                                          *detector._hsv_bounds['green'], dst=mask))
+    print(f"hsv_mask on a saturated 1080p scene: numba {t_numba:.2f}ms vs cv2 {t_cv2:.2f}ms")
+    return ok
+
+def check_hsv_pipeline(size=(480, 640), center=(300, 200), radius=8, seed=0):
+    """
+    Draw a coloured dot on a dark, slightly noisy frame and compare the
+    numba HSV path with the plain OpenCV one, both the cleaned-up mask and
+    the detected position, and time both
+
+    Returns:
+        bool: True if they agree (or numba isn't installed)
+    """
+    if hsv_mask is None:
+        print("numba not installed, nothing to check")
+        return True
+
+    rng = np.random.default_rng(seed)
+    ok = True
+    for color, bgr in DOT_COLORS.items():
+        frame = rng.integers(0, 30, size + (3,), dtype=np.uint8)
+        cv2.circle(frame, center, radius, bgr, -1)
+
+        detector = LaserPointerDetector(scale=1, skip_static=False, roi_radius=0, use_numba=True)
+        expected = np.empty(size, np.uint8)
+        mask = np.empty(size, np.uint8)
+        t_cv2 = time_call(lambda: detector._hsv_mask(frame, color, expected, False))
+        t_numba = time_call(lambda: detector._hsv_mask(frame, color, mask, True))
+        bad = np.count_nonzero(mask != expected)
+
+        # Full detection through the numba path
+        pos = detector.detect_laser_hsv(frame, color)
+        print(f"HSV mask {color}: {bad} mismatched pixels, found at {pos}, "
+              f"numba {t_numba:.2f}ms vs cv2 {t_cv2:.2f}ms")
+        ok = ok and bad == 0 and pos is not None and abs(pos[0] - center[0]) <= 1 and abs(pos[1] - center[1]) <= 1
+    return ok
+
 def main():
     parser = argparse.ArgumentParser(description='Laser Pointer Detection')
     parser.add_argument('--camera', type=int, default=0, help='Camera index (default: 0)')
@@ -146,15 +937,40 @@ def main():
                        help='Minimum detection area (default: 10)')
     parser.add_argument('--max-area', type=int, default=500,
                        help='Maximum detection area (default: 500)')
+    parser.add_argument('--scale', type=int, default=1,
+                       help='Detect on a frame this many times smaller, faster but can miss small dots (default: 1)')
+    parser.add_argument('--roi', type=int, default=80,
+                       help='Search radius around the predicted position, 0 = always full frame (default: 80)')
+    parser.add_argument('--cuda', action='store_true',
+                       help='Use the GPU for brightness preprocessing if OpenCV has CUDA')
+    parser.add_argument('--numba', action='store_true',
+                       help='Use the numba kernels instead of OpenCV (see --check-kernels for timings)')
+    parser.add_argument('--skip-static', action='store_true',
+                       help='Reuse the last result for bit-identical frames (e.g. video files)')
+    parser.add_argument('--check-kernels', action='store_true',
+                       help='Compare the numba kernels with plain OpenCV and exit')
 
     args = parser.parse_args()
 
+    if args.check_kernels:
+        check_blur_kernel()
+        check_hsv_kernel()
+        check_hsv_pipeline()
+        return
+
     # Initialize detector
     detector = LaserPointerDetector(
         min_area=args.min_area,
         max_area=args.max_area,
-        brightness_threshold=args.threshold
+        brightness_threshold=args.threshold,
+        use_cuda=args.cuda,
+        scale=args.scale,
+        roi_radius=args.roi,
+        skip_static=args.skip_static,
+        use_numba=args.numba
     )
+    if args.cuda and not detector.use_cuda:
+        print("Warning: CUDA not available, using the CPU instead")
 
     # Initialize camera
     cap = cv2.VideoCapture(args.camera)
@@ -166,29 +982,47 @@ def main():
     print("Press 'q' to quit, 's' to save current frame, 'c' to clear trail")
 
     # Trail for visualization
-    trail_points = []
-    max_trail_length = 50
+    trail = Trail(capacity=50)
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("Error: Could not read frame")
-            break
+    # Info text only depends on the arguments, so it is drawn once
+    info_overlay = None
 
-        # Detect laser pointer
-        if args.method == 'brightness':
-            laser_pos = detector.detect_laser(frame)
-        else:
-            laser_pos = detector.detect_laser_hsv(frame, args.color)
+    # Camera frame rate, for deciding when detection is falling behind
+    fps_target = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    capture_stats = {'dropped': 0}
+
+    # Capture and detection run in their own threads so camera I/O,
+    # detection and drawing overlap. The main thread only draws.
+    q_frames = queue.Queue(maxsize=2)
+    q_results = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=capture_loop, args=(cap, q_frames, stop, capture_stats), daemon=True),
+        threading.Thread(target=detect_loop,
+                         args=(detector, args, q_frames, q_results, stop, capture_stats,
+                               fps_target),
+                         daemon=True),
+    ]
+    for t in threads:
+        t.start()
+
+    while not stop.is_set():
+        try:
+            frame, laser_pos = q_results.get(timeout=0.1)
+        except queue.Empty:
+            # Keep the window responsive (and 'q' working) with no new frame
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                stop.set()
+                break
+            continue
 
         # Draw detection results
         if laser_pos:
             x, y = laser_pos
 
-            # Add to trail
-            trail_points.append((x, y))
-            if len(trail_points) > max_trail_length:
-                trail_points.pop(0)
+            # Add to trail (drops the oldest point itself)
+            trail.append(x, y)
 
             # Draw current position
             cv2.circle(frame, (x, y), 10, (0, 255, 0), 2)
@@ -198,19 +1032,14 @@ def main():
             cv2.putText(frame, f"Laser: ({x}, {y})", (x + 15, y - 15),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
 
-        # Draw trail
-        for i in range(1, len(trail_points)):
-            alpha = i / len(trail_points)  # Fade effect
-            color = (0, int(255 * alpha), 0)
-            cv2.line(frame, trail_points[i-1], trail_points[i], color, 2)
-
-        # Display detection method and parameters
-        info_text = f"Method: {args.method} | Threshold: {args.threshold}"
-        cv2.putText(frame, info_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        # Draw trail in a few bands (fade effect)
+        trail.draw(frame)
 
-        if args.method == 'hsv':
-            color_text = f"Color: {args.color}"
-            cv2.putText(frame, color_text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        # Copy the pre-rendered info text onto the top of the frame
+        if info_overlay is None or info_overlay[0].shape[1] != frame.shape[1]:
+            info_overlay = render_info_overlay(args, frame.shape[1], min(80, frame.shape[0]))
+        overlay, overlay_mask = info_overlay
+        np.copyto(frame[:overlay.shape[0]], overlay, where=overlay_mask[..., None])
 
         # Show frame
         cv2.imshow('Laser Pointer Detection', frame)
@@ -218,15 +1047,18 @@ def main():
         # Handle key presses
         key = cv2.waitKey(1) & 0xFF
         if key == ord('q'):
+            stop.set()
             break
         elif key == ord('s'):
             cv2.imwrite('laser_detection_frame.jpg', frame)
             print("Frame saved as 'laser_detection_frame.jpg'")
         elif key == ord('c'):
-            trail_points.clear()
+            trail.clear()
             print("Trail cleared")
 
     # Cleanup
+    for t in threads:
+        t.join(timeout=1.0)
     cap.release()
     cv2.destroyAllWindows()
 
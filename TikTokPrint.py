@@ -1,20 +1,35 @@
 ### Milo Tek - 15/05/2025 - Tiktok Print ###
 ## Based off a TikTok I saw ages ago, which showed someone making their own print function in a cool way!
 
-import string, time
+import string, sys, time
 
-def tiktokprint(text):
-    text = text.upper()
+def tiktoksteps(text):
+    # Yields what to write for each step of the animation
+    # Only the letter being spun gets rewritten, using a backspace
     letters = " " + string.ascii_uppercase
-    output = [""]*len(text)
-    for x in range(len(text)):
-        for letter in letters:
-            time.sleep(0.05)
-            output[x] = letter
-            print(*output)
-            if text[x] == output[x]:
-                break
-                
+    for x, char in enumerate(text.upper()):
+        # Jump straight to the target letter (anything not in letters stops on Z like before)
+        target_idx = letters.find(char)
+        if target_idx == -1:
+            target_idx = len(letters) - 1
+        yield (" " if x else "") + letters[0]
+        for i in range(1, target_idx + 1):
+            yield "\b" + letters[i]
+
+def tiktokprint(text, delay=0.05):
+    # Work out every write up front, then just play it back
+    plan = [(step.encode(), delay) for step in tiktoksteps(text)]
+
+    sys.stdout.flush()
+    write = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+    sleep = time.sleep
+    for data, wait in plan:
+        sleep(wait)
+        write(data)
+        flush()
+    print("") # Line break
+
 ## Example
 text = "I eat and devour babies"
 tiktokprint(text)
\ No newline at end of file